@@ -3,7 +3,10 @@ import os
 import io
 import re
 import json
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 import boto3
 from botocore.config import Config
@@ -1000,10 +1003,17 @@ def _pdf_response_from_html(html_str: str, *, filename="inside-imaging-report.pd
 
 
 
+# Sentence terminators for the upload page's report stats
+_REPORT_SENTENCE_RX = re.compile(r"[.!?]+")
+
 _TRIAGE_SECTION_RX = re.compile(
     r"(?im)^\s*(findings|impression|conclusion|technique|history|clinical\s+history|"
     r"indication|comparison|procedure|exam(?:ination)?|study|details)\s*[:\-]"
 )
+# Word runs as the triage thresholds were tuned on (x-ray counts as two);
+# \w+ already stops at word boundaries, so the \b anchors were redundant.
+_TRIAGE_WORD_RX = re.compile(r"\w+")
+_TRIAGE_MEASUREMENT_RX = re.compile(r"\b\d+(?:\.\d+)?\s*(?:mm|cm)\b")
 _TRIAGE_MODALITY_TOKENS = [
     "ct", "mri", "x-ray", "xray", "ultrasound", "pet", "spect", "angiogram",
     "fluoroscopy", "mammo", "mammogram", "cect", "mra", "cta", "doppler",
@@ -1022,6 +1032,35 @@ _TRIAGE_NEGATIVE_TOKENS = [
     "canvas site", "attendance policy",
 ]
 
+# Legacy keyword lists behind the radiology/anatomy counts
+_TRIAGE_RADIOLOGY_KEYWORDS = (
+    "radiology", "radiologist", "imaging", "scan", "ct", "mri", "x-ray", "xray",
+    "ultrasound", "pet", "findings", "impression", "technique", "contrast",
+    "examination", "study", "patient", "indication", "conclusion", "comparison",
+)
+_TRIAGE_ANATOMY_TERMS = (
+    "brain", "lung", "liver", "kidney", "heart", "spine", "abdomen", "pelvis",
+    "chest", "thorax", "head", "skull", "bone", "soft tissue", "vessel", "artery",
+    "vein", "organ", "lesion", "mass", "nodule",
+)
+
+
+def _count_highlights(*fragments: str | None) -> tuple[int, int]:
+    """Count positive/negative highlight spans across HTML fragments."""
+    pos = neg = 0
+    for html_part in fragments:
+        if html_part:
+            pos += html_part.count('class="ii-pos"')
+            neg += html_part.count('class="ii-neg"')
+    return pos, neg
+
+
+# Triage results for recently seen reports, keyed on a digest of the snippet so
+# the report text itself is never kept in memory
+_TRIAGE_CACHE: "OrderedDict[bytes, tuple[bool, dict]]" = OrderedDict()
+_TRIAGE_CACHE_LOCK = threading.Lock()
+_TRIAGE_CACHE_SIZE = 128
+
 
 def _triage_radiology_report(text: str) -> tuple[bool, dict]:
     """Quick heuristic to reject non-radiology uploads before hitting the LLM."""
@@ -1031,30 +1070,42 @@ def _triage_radiology_report(text: str) -> tuple[bool, dict]:
         return False, {"reason": "empty"}
 
     snippet = sample[:20000]
+    digest = hashlib.sha256(snippet.encode("utf-8", "surrogatepass")).digest()
+    with _TRIAGE_CACHE_LOCK:
+        result = _TRIAGE_CACHE.get(digest)
+        if result is not None:
+            _TRIAGE_CACHE.move_to_end(digest)
+    if result is None:
+        result = _triage_snippet(snippet)
+        with _TRIAGE_CACHE_LOCK:
+            _TRIAGE_CACHE[digest] = result
+            while len(_TRIAGE_CACHE) > _TRIAGE_CACHE_SIZE:
+                _TRIAGE_CACHE.popitem(last=False)
+
+    ok, diagnostics = result
+    # Results are cached, so hand callers their own copies of the lists
+    return ok, {key: value[:] if isinstance(value, list) else value for key, value in diagnostics.items()}
+
+
+def _triage_snippet(snippet: str) -> tuple[bool, dict]:
+    """Score a capped report snippet."""
     lower = snippet.lower()
 
     # Basic counts
-    words = re.findall(r"\b\w+\b", snippet)
-    word_count = len(words)
+    word_count = len(_TRIAGE_WORD_RX.findall(snippet))
     section_hits = {match.group(1).lower() for match in _TRIAGE_SECTION_RX.finditer(snippet)}
     modality_hits = [token for token in _TRIAGE_MODALITY_TOKENS if token in lower]
     imaging_hits = [token for token in _TRIAGE_IMAGING_TERMS if token in lower]
-    measurement_count = len(re.findall(r"\b\d+(?:\.\d+)?\s*(?:mm|cm)\b", lower))
+    # Every measurement ends in mm/cm; skip the scan when neither unit appears
+    if "mm" in lower or "cm" in lower:
+        measurement_count = len(_TRIAGE_MEASUREMENT_RX.findall(lower))
+    else:
+        measurement_count = 0
     negative_hits = [token for token in _TRIAGE_NEGATIVE_TOKENS if token in lower]
 
     # Legacy keyword heuristics to preserve prior thresholds
-    radiology_keywords = [
-        "radiology", "radiologist", "imaging", "scan", "ct", "mri", "x-ray", "xray",
-        "ultrasound", "pet", "findings", "impression", "technique", "contrast",
-        "examination", "study", "patient", "indication", "conclusion", "comparison",
-    ]
-    anatomy_terms = [
-        "brain", "lung", "liver", "kidney", "heart", "spine", "abdomen", "pelvis",
-        "chest", "thorax", "head", "skull", "bone", "soft tissue", "vessel", "artery",
-        "vein", "organ", "lesion", "mass", "nodule",
-    ]
-    radiology_keyword_count = sum(1 for keyword in radiology_keywords if keyword in lower)
-    anatomy_count = sum(1 for term in anatomy_terms if term in lower)
+    radiology_keyword_count = sum(1 for keyword in _TRIAGE_RADIOLOGY_KEYWORDS if keyword in lower)
+    anatomy_count = sum(1 for term in _TRIAGE_ANATOMY_TERMS if term in lower)
 
     score = 0
     if word_count >= 90:
@@ -1227,15 +1278,9 @@ def upload():
     # Patient and study from structured metadata
     patient_struct = S.get("patient") if isinstance(S, dict) else None
     if isinstance(patient_struct, dict) and patient_struct:
-        patient = {
-            "hospital": patient_struct.get("hospital", ""),
-            "study": patient_struct.get("study", "Unknown"),
-            "name": full_patient_name,  # Restore full name for display (never sent to OpenAI)
-            "sex": patient_struct.get("sex", ""),
-            "age": patient_struct.get("age", ""),
-            "date": patient_struct.get("date", ""),
-            "history": patient_struct.get("history", ""),
-        }
+        # build_structured already fills every patient field; copy it in one go
+        # and restore the full name for display (never sent to OpenAI)
+        patient = {**patient_struct, "name": full_patient_name}
     else:
         patient = {
             "hospital": S.get("hospital", ""),
@@ -1250,17 +1295,16 @@ def upload():
     structured = S
 
     # Simple report stats for UI
-    high_html = (S.get("findings", "") or "") + (S.get("conclusion", "") or "")
+    highlight_pos, highlight_neg = _count_highlights(S.get("findings"), S.get("conclusion"))
     report_stats = {
         "words": len((extracted or "").split()),
-        "sentences": len(re.findall(r"[.!?]+", extracted or "")),
-        "highlights_positive": high_html.count('class="ii-pos"'),
-        "highlights_negative": high_html.count('class="ii-neg"'),
+        "sentences": len(_REPORT_SENTENCE_RX.findall(extracted or "")),
+        "highlights_positive": highlight_pos,
+        "highlights_negative": highlight_neg,
     }
 
     # Calculate disease tags for immediate display
-    findings_blob = (structured.get("findings") or "") + (structured.get("conclusion") or "") + (structured.get("concern") or "")
-    disease_tags = db.detect_disease_tags(findings_blob)
+    disease_tags = db.detect_disease_tags(db.report_text_blob(structured))
     
 
 
@@ -1273,7 +1317,9 @@ def upload():
     report_id = None
     try:
         username = session.get("username", "")
-        report_id = db.store_report_event(patient, structured, report_stats, lang, username, context)
+        report_id = db.store_report_event(
+            patient, structured, report_stats, lang, username, context, disease_tags=disease_tags
+        )
     except Exception:
         logging.exception("Failed to persist report analytics.")
 
@@ -1314,9 +1360,7 @@ def report_detail(report_id: int):
     patient = dict(record.get("patient") or {})
     language = record.get("language") or "English"
 
-    findings_blob = (structured.get("findings") or "") + (structured.get("conclusion") or "")
-    highlight_pos = findings_blob.count('class="ii-pos"')
-    highlight_neg = findings_blob.count('class="ii-neg"')
+    highlight_pos, highlight_neg = _count_highlights(structured.get("findings"), structured.get("conclusion"))
 
     structured.setdefault("word_count", record.get("word_count", 0))
     structured.setdefault("sentence_count", 0)
@@ -1337,7 +1381,7 @@ def report_detail(report_id: int):
     study = {"organ": patient.get("study") or "Unknown"}
     disease_tags = record.get("disease_tags") or []
     if isinstance(disease_tags, str) and disease_tags:
-        disease_tags = [t.strip() for t in disease_tags.split(",") if t.strip()]
+        disease_tags = [t for t in map(str.strip, disease_tags.split(",")) if t]
 
     return render_template(
         "result.html",
@@ -1446,6 +1490,10 @@ def legacy_language():
     return redirect(url_for("magazine"))
 
 
+# '#page=9' style anchors on magazine blog links
+_BLOG_PAGE_RX = re.compile(r'page=(\d+)')
+
+
 @app.route("/blogs")
 def blogs():
     # Dedicated blogs listing page - attempt to extract full post content from magazine PDF
@@ -1456,8 +1504,7 @@ def blogs():
         post = dict(p)
         # If URL contains a page anchor like '#page=9' try to extract that page from the PDF
         url = post.get('url', '') or ''
-        import re
-        m = re.search(r'page=(\d+)', url)
+        m = _BLOG_PAGE_RX.search(url)
         if m and os.path.exists(mag_pdf):
             try:
                 from pdfminer.high_level import extract_text
@@ -228,6 +228,12 @@ SEED_SLUGS = {
     "Abdominal aortic calcification": ["aortic-calcification", "vascular-calcifications", "aortic-atherosclerosis"],
 }
 
+# Slug and image-URL patterns
+_SLUG_PARENS_RX = re.compile(r"\(.*?\)")
+_SLUG_JUNK_RX = re.compile(r"[^a-z0-9\s-]+")
+_CASE_WORD_RX = re.compile(r"\bcase\b", re.I)
+_PROD_IMG_RX = re.compile(r'https://prod-images-static\.radiopaedia\.org/images/[^\s"\'<>]+')
+
 # ------------------------ session and helpers ------------------------
 
 def make_session():
@@ -273,10 +279,11 @@ def sleep(a=0.6, b=1.2):
 
 def norm_slug(s: str) -> str:
     s = s.lower()
-    s = re.sub(r"\(.*?\)", "", s)
+    s = _SLUG_PARENS_RX.sub("", s)
     s = s.replace("&", "and")
-    s = re.sub(r"[^a-z0-9\s-]+", "", s)
-    s = re.sub(r"\s+", "-", s).strip("-")
+    s = _SLUG_JUNK_RX.sub("", s)
+    # str.split() drops the same whitespace \s matches, ends included
+    s = "-".join(s.split()).strip("-")
     return s
 
 
@@ -327,7 +334,7 @@ def push_img(store: list, u: str):
 def has_case_word(text: str) -> bool:
     if not text:
         return False
-    return re.search(r"\bcase\b", text, flags=re.I) is not None
+    return _CASE_WORD_RX.search(text) is not None
 
 
 def fetch(session, url: str, warm: bool = True):
@@ -356,8 +363,7 @@ def collect_case_caption_images(html: str, limit: int, session) -> list:
     out = []
 
     # 1) Extract prod-images URLs directly from HTML using regex
-    prod_pattern = r'https://prod-images-static\.radiopaedia\.org/images/[^\s"\'<>]+'
-    found = re.findall(prod_pattern, html)
+    found = _PROD_IMG_RX.findall(html)
     for u in found:
         # Prefer _big_gallery versions for better quality
         if '_big_gallery' in u or '_gallery' in u:
@@ -388,7 +394,7 @@ def collect_case_caption_images(html: str, limit: int, session) -> list:
         for url in case_links:
             r = fetch(session, url, warm=False)
             if r and r.status_code == 200:
-                case_imgs = re.findall(prod_pattern, r.text)
+                case_imgs = _PROD_IMG_RX.findall(r.text)
                 for u in case_imgs:
                     push_img(out, u)
                     if len(out) >= limit:
@@ -13,6 +13,7 @@ from typing import Dict, Optional, Any, List
 from collections import Counter
 import re
 import hashlib
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 
@@ -179,14 +180,25 @@ def add_patient_record(data: Dict[str, Any]) -> int:
     return int(record_id)
 
 
+_DIGITS_RX = re.compile(r"\d+")
+
+
 def _parse_age(raw: Any) -> Optional[int]:
     if raw is None:
         return None
-    parts = re.findall(r"\d+", str(raw))
-    if not parts:
-        return None
+    s = str(raw)
+    # Bare digit strings ("45") are the common case; skip the regex for them.
+    # isdecimal matches exactly the characters \d does, so int() agrees.
+    if s.isdecimal():
+        digits = s
+    else:
+        # Only the first run of digits matters; stop scanning there
+        m = _DIGITS_RX.search(s)
+        if not m:
+            return None
+        digits = m.group(0)
     try:
-        return int(parts[0])
+        return int(digits)
     except Exception:
         return None
 
@@ -202,7 +214,13 @@ _DISEASE_KEYWORDS = {
     "lung_disease": ["copd", "emphysema", "bronchiectasis", "bullae", "bulla", "effusion", "pneumothorax", "air pocket"],
     "normal": ["normal", "unremarkable", "no acute", "negative", "clear", "intact"],
 }
+# Walked in label order so detect_disease_tags' output is already sorted
+_DISEASE_KEYWORDS_SORTED = sorted(_DISEASE_KEYWORDS.items())
+
 
+# Pure function of the name; the stats page re-normalizes the same handful of
+# distinct study names on every load
+@lru_cache(maxsize=512)
 def normalize_study_name(study: str) -> str:
     """Normalize raw study names into professional medical language for statistics."""
     if not study or study.lower() == "unknown":
@@ -279,10 +297,11 @@ def normalize_study_name(study: str) -> str:
 
 def detect_disease_tags(text: str) -> List[str]:
     low = (text or "").lower()
-    tags = []
-    for label, keywords in _DISEASE_KEYWORDS.items():
-        if any(keyword in low for keyword in keywords):
-            tags.append(label)
+    # Labels are unique and visited in sorted order, so no set/sort pass
+    tags = [
+        label for label, keywords in _DISEASE_KEYWORDS_SORTED
+        if any(keyword in low for keyword in keywords)
+    ]
     
     # If other tags exist, remove 'normal' if present
     if "normal" in tags and len(tags) > 1:
@@ -290,16 +309,16 @@ def detect_disease_tags(text: str) -> List[str]:
         
     if not tags:
         return ["general"]
-    return sorted(set(tags))
+    return tags
 
 
 def _format_tags_display(tags: List[str]) -> List[str]:
     return [t.replace("_", " ").strip().title() for t in tags if t]
 
 
-def store_report_event(patient: Dict[str, Any], structured: Dict[str, Any], report_stats: Dict[str, Any], language: str, username: str = "", context: str = "") -> int:
-    """Persist a summarized encounter for analytics without storing PHI."""
-    text_blob = " ".join(
+def report_text_blob(structured: Dict[str, Any]) -> str:
+    """Join the findings, conclusion and concern text that disease tags are detected on."""
+    return " ".join(
         filter(
             None,
             [
@@ -309,7 +328,16 @@ def store_report_event(patient: Dict[str, Any], structured: Dict[str, Any], repo
             ],
         )
     )
-    disease_tags = detect_disease_tags(text_blob)
+
+
+def store_report_event(patient: Dict[str, Any], structured: Dict[str, Any], report_stats: Dict[str, Any], language: str, username: str = "", context: str = "", disease_tags: Optional[List[str]] = None) -> int:
+    """Persist a summarized encounter for analytics without storing PHI.
+
+    Pass disease_tags when the caller has already detected them on the same
+    structured output; otherwise they are detected here.
+    """
+    if disease_tags is None:
+        disease_tags = detect_disease_tags(report_text_blob(structured))
 
     record = {
         "name": patient.get("name", ""),
@@ -416,8 +444,7 @@ def get_stats() -> Dict[str, Any]:
     cur.execute("SELECT disease_tags FROM patients WHERE ifnull(disease_tags, '') != ''")
     disease_counter: Counter[str] = Counter()
     for (raw_tags,) in cur.fetchall():
-        tags = [t.strip() for t in raw_tags.split(",") if t.strip()]
-        disease_counter.update(tags)
+        disease_counter.update(t for t in map(str.strip, raw_tags.split(",")) if t)
     disease_mix = [
         {"label": label, "count": count}
         for label, count in disease_counter.most_common()
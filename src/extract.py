@@ -17,9 +17,7 @@ import boto3, base64
 def _clean(s: str) -> str:
     """Clean a raw string by stripping whitespace on each line and collapsing
     multiple blank lines into a single blank line."""
-    lines = s.splitlines()
-    cleaned_lines = [line.rstrip() for line in lines]
-    return "\n".join(cleaned_lines).strip()
+    return "\n".join(line.rstrip() for line in s.splitlines()).strip()
 
 def from_pdf(path: Path) -> str:
     """Extract text from a PDF file using pdfplumber.
@@ -13,11 +13,69 @@ about pulling data out of unstructured reports.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 
 # Regular expression to detect an all-caps line which may be part of a hospital
 # header. Most hospital names and department headings are presented like this.
 UPPER_LINE = re.compile(r"^[A-Z0-9&@/()'’.,\- ]{12,}$")
+# The line boundaries str.splitlines() recognises
+_LINE_BREAK_RX = re.compile(r"\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# Metadata and section patterns
+_NAME_RX = re.compile(r"(?i)\bNAME\b[:\s\-–]*([A-Z][A-Za-z' .\-]+)")
+_AGE_RX = re.compile(r"(?i)\bAGE\b[:\s\-–]*([0-9]{1,3})")
+_SEX_RX = re.compile(r"(?i)\bSEX\b[:\s\-–]*([MF]|Male|Female)")
+_SEX_MAP = {"m": "M", "male": "M", "f": "F", "female": "F"}
+_DATE_RX = re.compile(
+    r"(?i)\bDATE\b[:\s]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})"
+)
+# A single \n suffices after [:\s]* (which already absorbs earlier newlines);
+# \n+ picked the same line but backtracked quadratically on blank-line runs.
+_PROC_BLOCK_RX = re.compile(
+    r"(?im)^(?:PROCEDURE\s+DETAILS?|EXAMINATION|STUDY|EXAM)(?:[:\s]*)\n([^\n]{10,150})"
+)
+_PROC_INLINE_RX = re.compile(r"(?im)^(?:EXAMINATION|STUDY|PROCEDURE|EXAM)(?:\s+DETAILS)?[:\s]+([^\n]{3,100})")
+_MODALITY_LINE_RX = re.compile(
+    r"(?im)^(CT|MRI|X[- ]?RAY|ULTRASOUND|USG|MAMMOGRAM|PET|ANGIOGRAPHY|FLUOROSCOPY)[^\n]{0,80}"
+)
+_SECTION_STOP_RX = re.compile(r"(?m)^(?:IMPRESSION|CONCLUSION|REPORT|RESULTS|DISCUSSION|NOTE|SUMMARY)\b")
+_FINDINGS_FALLBACK_RX = re.compile(r"(?is)\bFINDINGS?\b[:\s\-]*\n?(.*)")
+
+# Body-region patterns for _simplify_study_name, in reporting order
+_BODY_REGIONS = [
+    (re.compile(pattern, re.IGNORECASE), region_name)
+    for pattern, region_name in (
+        (r"\b(lumbar|lower back|L[\s-]?spine)\b", "lumbar spine"),
+        (r"\b(cervical|neck|C[\s-]?spine)\b", "cervical spine"),
+        (r"\b(thoracic|T[\s-]?spine)\b", "thoracic spine"),
+        (r"\b(spine|spinal)\b", "spine"),
+        (r"\b(brain|head|cranial)\b", "brain"),
+        (r"\b(chest|thorax|lung)\b", "chest"),
+        (r"\b(abdomen|abdominal|tummy|belly)\b", "abdomen"),
+        (r"\b(pelvis|pelvic)\b", "pelvis"),
+        (r"\b(knee)\b", "knee"),
+        (r"\b(shoulder)\b", "shoulder"),
+        (r"\b(hip)\b", "hip"),
+        (r"\b(ankle)\b", "ankle"),
+        (r"\b(foot|feet)\b", "foot"),
+        (r"\b(hand)\b", "hand"),
+        (r"\b(wrist)\b", "wrist"),
+        (r"\b(elbow)\b", "elbow"),
+    )
+]
+
+# Modality anywhere in a study description (unlike _MODALITY_LINE_RX, which
+# only looks at line starts in the full report)
+_STUDY_MODALITY_RX = re.compile(
+    r"\b(MRI|CT|X-RAY|ULTRASOUND|MAMMOGRAM|PET|ANGIOGRAPHY|FLUOROSCOPY)\b", re.IGNORECASE
+)
+# Both contrast phrasings in one scan; lastgroup says which side matched
+_CONTRAST_RX = re.compile(
+    r"\b(?:(?P<without>without contrast|non-contrast|without dye|no contrast)"
+    r"|(?P<with>with contrast|with iv contrast|with dye))\b",
+    re.IGNORECASE,
+)
 
 def _simplify_study_name(study: str) -> str:
     """Simplify verbose study descriptions to concise format.
@@ -33,7 +91,7 @@ def _simplify_study_name(study: str) -> str:
         return study
     
     # Extract modality (MRI, CT, X-ray, etc.)
-    modality_match = re.search(r"\b(MRI|CT|X-RAY|ULTRASOUND|MAMMOGRAM|PET|ANGIOGRAPHY|FLUOROSCOPY)\b", study, re.IGNORECASE)
+    modality_match = _STUDY_MODALITY_RX.search(study)
     if not modality_match:
         return study  # Can't simplify if no modality found
     
@@ -41,37 +99,18 @@ def _simplify_study_name(study: str) -> str:
     if modality == "X-RAY":
         modality = "X-ray"
     
-    # Extract body region - look for common anatomical terms
-    body_regions = {
-        r"\b(lumbar|lower back|L[\s-]?spine)\b": "lumbar spine",
-        r"\b(cervical|neck|C[\s-]?spine)\b": "cervical spine",
-        r"\b(thoracic|T[\s-]?spine)\b": "thoracic spine",
-        r"\b(spine|spinal)\b": "spine",
-        r"\b(brain|head|cranial)\b": "brain",
-        r"\b(chest|thorax|lung)\b": "chest",
-        r"\b(abdomen|abdominal|tummy|belly)\b": "abdomen",
-        r"\b(pelvis|pelvic)\b": "pelvis",
-        r"\b(knee)\b": "knee",
-        r"\b(shoulder)\b": "shoulder",
-        r"\b(hip)\b": "hip",
-        r"\b(ankle)\b": "ankle",
-        r"\b(foot|feet)\b": "foot",
-        r"\b(hand)\b": "hand",
-        r"\b(wrist)\b": "wrist",
-        r"\b(elbow)\b": "elbow",
-    }
-    
-    regions_found = []
-    for pattern, region_name in body_regions.items():
-        if re.search(pattern, study, re.IGNORECASE):
-            if region_name not in regions_found:
-                regions_found.append(region_name)
+    # Extract body region - look for common anatomical terms.
+    # dict.fromkeys dedupes by hash while keeping first-seen order
+    regions_found = list(dict.fromkeys(
+        region_name for rx, region_name in _BODY_REGIONS if rx.search(study)
+    ))
     
-    # Contrast detection
+    # Contrast detection: any non-contrast phrase wins over a with-contrast one
     contrast = ""
-    if re.search(r"\b(without contrast|non-contrast|without dye|no contrast)\b", study, re.IGNORECASE):
-        contrast = " (non-contrast)"
-    elif re.search(r"\b(with contrast|with iv contrast|with dye)\b", study, re.IGNORECASE):
+    for m in _CONTRAST_RX.finditer(study):
+        if m.lastgroup == "without":
+            contrast = " (non-contrast)"
+            break
         contrast = " (with contrast)"
 
     if regions_found:
@@ -81,6 +120,15 @@ def _simplify_study_name(study: str) -> str:
         # Fallback: just return the modality if we can't identify body region
         return f"{modality}{contrast}"
 
+# En/em dashes to hyphen, and non-breaking space and tab to space, in one pass
+_NORM_CHARS = str.maketrans({"\u2013": "-", "\u2014": "-", "\u00a0": " ", "\t": " "})
+# Tabs are already spaces after _NORM_CHARS, so only real runs need rewriting
+_SPACE_RUN_RX = re.compile(r" {2,}")
+# Whitespace run ending in a newline. Only start a match at the beginning of a
+# whitespace run: a bare \s+\n retries from every position inside a long run
+# with no newline (e.g. stray \r or \f from PDFs), which is quadratic.
+_TRAILING_SPACE_RX = re.compile(r"(?<!\s)\s+\n")
+
 def _norm(s: str) -> str:
     """Normalize whitespace and common dash characters in a string.
 
@@ -88,12 +136,12 @@ def _norm(s: str) -> str:
     spaces, and trims trailing whitespace on each line. Returns the cleaned
     string.
     """
-    # Normalize various dash characters to a single hyphen
-    s = s.replace('\u2013', '-').replace('\u2014', '-').replace('\u00a0', ' ')
+    # Normalize various dash characters to a single hyphen, tabs to spaces
+    s = s.translate(_NORM_CHARS)
     # Collapse multiple spaces
-    s = re.sub(r"[ \t]+", " ", s)
+    s = _SPACE_RUN_RX.sub(" ", s)
     # Remove spaces before newlines
-    s = re.sub(r"\s+\n", "\n", s)
+    s = _TRAILING_SPACE_RX.sub("\n", s)
     return s.strip()
 
 def _get_block(text: str, start_keys: Tuple[str, ...]) -> str:
@@ -104,21 +152,28 @@ def _get_block(text: str, start_keys: Tuple[str, ...]) -> str:
     until the next major section (another all caps heading or a double
     newline). If no key is found, return an empty string.
     """
-    t = text
     for k in start_keys:
+        header_rx, label_rx = _block_patterns(k)
         # Search for the section header (case-insensitive)
-        m = re.search(rf"(?is)\b{k}\b\s*[:\-]?\s*(.*)", t)
+        m = header_rx.search(text)
         if m:
             # Slice the text from this header onward
-            rest = t[m.start():]
+            rest = text[m.start():]
             # Look for the next all-caps header indicating the next section
-            stop = re.search(r"(?m)^(?:IMPRESSION|CONCLUSION|REPORT|RESULTS|DISCUSSION|NOTE|SUMMARY)\b", rest)
+            stop = _SECTION_STOP_RX.search(rest)
             block = rest if not stop else rest[:stop.start()]
             # Remove the header itself
-            block = re.sub(rf"(?is)^{k}\s*[:\-]?\s*", "", block).strip()
-            return block
+            return label_rx.sub("", block).strip()
     return ""
 
+@lru_cache(maxsize=None)
+def _block_patterns(key: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compiled (header search, header strip) patterns for a section key."""
+    return (
+        re.compile(rf"(?is)\b{key}\b"),
+        re.compile(rf"(?is)^{key}\s*[:\-]?\s*"),
+    )
+
 def parse_metadata(text: str) -> Dict[str, str]:
     """Parse key metadata fields from a radiology report.
 
@@ -130,40 +185,36 @@ def parse_metadata(text: str) -> Dict[str, str]:
 
     # Attempt to identify a hospital header by looking for consecutive
     # uppercase lines near the top of the document.
-    lines = t.splitlines()
     head_upper = []
-    for line in lines[:10]:
-        if UPPER_LINE.match(line.strip()):
-            head_upper.append(line.strip())
+    for line in _LINE_BREAK_RX.split(t, 10)[:10]:
+        line = line.strip()
+        if UPPER_LINE.match(line):
+            head_upper.append(line)
         elif head_upper:
             break
     hospital = " ".join(head_upper[:2]).strip() or ""
 
     # Patient name
     name = ""
-    m = re.search(r"(?i)\bNAME\b[:\s\-–]*([A-Z][A-Za-z' .\-]+)", t)
+    m = _NAME_RX.search(t)
     if m:
         name = m.group(1).strip()
 
     # Patient age
     age = ""
-    m = re.search(r"(?i)\bAGE\b[:\s\-–]*([0-9]{1,3})", t)
+    m = _AGE_RX.search(t)
     if m:
         age = m.group(1).strip()
 
     # Patient sex (M/F)
     sex = ""
-    m = re.search(r"(?i)\bSEX\b[:\s\-–]*([MF]|Male|Female)", t)
+    m = _SEX_RX.search(t)
     if m:
-        v = m.group(1).strip().lower()
-        sex = "M" if v.startswith("m") else ("F" if v.startswith("f") else "")
+        sex = _SEX_MAP.get(m.group(1).strip().lower(), "")
 
     # Date of study
     date = ""
-    m = re.search(
-        r"(?i)\bDATE\b[:\s]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        t,
-    )
+    m = _DATE_RX.search(t)
     if m:
         date = m.group(1).strip()
 
@@ -172,22 +223,19 @@ def parse_metadata(text: str) -> Dict[str, str]:
     
     # Strategy 1: Look for "Procedure Details" or similar headers and extract the description
     # This captures the full description like "CT (special x-ray) of your chest..."
-    proc_match = re.search(
-        r"(?im)^(?:PROCEDURE\s+DETAILS?|EXAMINATION|STUDY|EXAM)(?:[:\s]*)\n+([^\n]{10,150})",
-        t
-    )
+    proc_match = _PROC_BLOCK_RX.search(t)
     if proc_match:
         study = proc_match.group(1).strip()
     
     # Strategy 2: If header had content on same line (e.g., "EXAMINATION: CT Chest")
     if not study:
-        m = re.search(r"(?im)^(?:EXAMINATION|STUDY|PROCEDURE|EXAM)(?:\s+DETAILS)?[:\s]+([^\n]{3,100})", t)
+        m = _PROC_INLINE_RX.search(t)
         if m:
             study = m.group(1).strip()
     
     # Strategy 3: Fallback to detecting modality keywords at start of line
     if not study:
-        m = re.search(r"(?im)^(CT|MRI|X[- ]?RAY|ULTRASOUND|USG|MAMMOGRAM|PET|ANGIOGRAPHY|FLUOROSCOPY)[^\n]{0,80}", t)
+        m = _MODALITY_LINE_RX.search(t)
         if m:
             study = m.group(0).strip()
     
@@ -220,7 +268,7 @@ def sections_from_text(text: str) -> Dict[str, str]:
     impression = _get_block(t, ("IMPRESSION", "CONCLUSION"))
     if not findings:
         # Fallback: capture after the first FINDINGS heading if present
-        m = re.search(r"(?is)\bFINDINGS?\b[:\s\-]*\n?(.*)", t)
+        m = _FINDINGS_FALLBACK_RX.search(t)
         if m:
             findings = m.group(1).strip()
     return {
@@ -16,7 +16,11 @@ import csv
 import html
 import logging
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 from .parse import parse_metadata, sections_from_text
@@ -49,124 +53,263 @@ class Glossary:
 # -----------------------
 # HTML helper functions
 # -----------------------
-_DASH_LINE_RX = re.compile(r"^\s*[-•]\s+(.+?)\s*$")
-
-
 def _dashes_to_ul(text: str) -> str:
-    """Convert dash/•-prefixed lines to a <ul> list.
+    """Convert dash-prefixed lines to a <ul> list.
 
     If there are no dash bullets, return text as-is (HTML-escaped).
     """
     if not text:
         return ""
+    if "-" not in text:
+        # Cheap prefilter: no dash means no bullet line can match
+        return html.escape(text)
 
-    lines = [ln.rstrip() for ln in (text or "").splitlines()]
+    # Accept only standard "- item" bullets to avoid non-ASCII issues. A
+    # prefix test on the stripped line is all the old ^\s*-\s+(.+)$ match
+    # did (str.isspace and \s agree), without a regex call per line.
     items: List[str] = []
-    for ln in lines:
-        m = _DASH_LINE_RX.match(ln)
-        if m:   
-            items.append(m.group(1).strip())
+    for ln in text.splitlines():
+        ln = ln.strip()
+        if ln[:1] == "-" and ln[1:2].isspace():
+            items.append(ln[1:].strip())
 
     if not items:
         # No bullets detected; return safe paragraph text
         return html.escape(text)
+    return _items_to_ul(items)
 
-    lis = "".join(f"<li>{html.escape(it)}</li>" for it in items if it)
-    return f"<ul>{lis}</ul>"
 
+def _items_to_ul(items: List[str]) -> str:
+    """Render already-extracted bullet texts as an escaped <ul>, skipping empties."""
+    lis = "</li><li>".join(html.escape(it) for it in items if it)
+    return f"<ul><li>{lis}</li></ul>" if lis else "<ul></ul>"
 
-def _strip_html(s: str) -> str:
-    return re.sub(r"<[^>]+>", " ", s or "").strip()
 
-# Accept only standard dash bullets to avoid non-ASCII issues
-_DASH_LINE_RX = re.compile(r"^\s*-\s+(.+?)\s*$")
+_TAG_RX = re.compile(r"<[^>]+>")
+_LI_RX = re.compile(r"<li>(.*?)</li>", re.S | re.I)
+
+
+def _strip_html(s: str) -> str:
+    s = s or ""
+    # Most callers pass escaped plain text; skip the regex when no tag can occur
+    if "<" not in s:
+        return s.strip()
+    return _TAG_RX.sub(" ", s).strip()
+
+
+# Jargon -> everyday wording for the fallback path (English only)
+_LAY_TERMS: List[Tuple[str, str]] = [
+    # Spinal anatomy - specific levels first
+    (r"\bL5/S1\b", "between the lowest back bone and tailbone"),
+    (r"\bL4/L5\b", "between the 4th and 5th bones in your lower back"),
+    (r"\bL3/L4\b", "between the 3rd and 4th bones in your lower back"),
+    (r"\bL2/L3\b", "between the 2nd and 3rd bones in your lower back"),
+    (r"\bL1/L2\b", "between the 1st and 2nd bones in your lower back"),
+    (r"\bC6/C7\b", "between the 6th and 7th bones in your neck"),
+    (r"\bC5/C6\b", "between the 5th and 6th bones in your neck"),
+    (r"\bC4/C5\b", "between the 4th and 5th bones in your neck"),
+    (r"\bC3/C4\b", "between the 3rd and 4th bones in your neck"),
+    (r"\bT\d+/T\d+\b", "between bones in your mid-back"),
+    (r"\bL\d+/L\d+\b", "between bones in your lower back"),
+    (r"\bC\d+/C\d+\b", "between bones in your neck"),
+    # General spinal terms
+    (r"\blumbar spine\b", "lower back"),
+    (r"\bthoracic spine\b", "mid-back"),
+    (r"\bcervical spine\b", "neck"),
+    (r"\bvertebrae\b", "bones in the spine"),
+    (r"\bvertebra\b", "bone in the spine"),
+    (r"\bforamina\b", "nerve tunnels"),
+    (r"\bforamen\b", "nerve tunnel"),
+    (r"\bdisc herniation\b", "slipped disc"),
+    (r"\bherniated disc\b", "slipped disc"),
+    (r"\bspinal canal\b", "main channel in the spine"),
+    (r"\bnerve root\b", "nerve branch"),
+    (r"\bspinal cord\b", "main nerve bundle in the spine"),
+    # Lymph and glands
+    (r"\badenopathy\b", "swollen glands"),
+    (r"\blymphadenopathy\b", "swollen glands"),
+    (r"\blymph nodes\b", "infection-fighting glands"),
+    (r"\blymph node\b", "infection-fighting gland"),
+    # Fluid and swelling
+    (r"\bedema\b", "swelling"),
+    (r"\bpleural effusion\b", "fluid around the lung"),
+    (r"\beffusion\b", "fluid buildup"),
+    (r"\bascites\b", "fluid in the belly"),
+    # Body regions
+    (r"\babdomen(?:al)?\b", "tummy"),
+    (r"\burinary tract\b", "urine system"),
+    (r"\bureters\b", "urine tubes"),
+    (r"\bureter\b", "urine tube"),
+    # Abnormalities
+    (r"\blesions\b", "abnormal spots"),
+    (r"\blesion\b", "abnormal spot"),
+    (r"\bmass(?:es)?\b", "lump"),
+    (r"\bneoplasm(?:s)?\b", "cancer"),
+    # Organs
+    (r"\bhepatic\b", "liver"),
+    (r"\brenal\b", "kidney"),
+    (r"\bpulmonary\b", "lung"),
+    (r"\bcervix\b", "neck of the womb"),
+    # Conditions
+    (r"\bhydronephrosis\b", "severe urine backup"),
+    (r"\bstenosis\b", "narrowing"),
+    (r"\bdilat(?:e|ed|ation)\b", "widened"),
+    # Procedures
+    (r"\bintravenous contrast\b", "dye through a vein"),
+    (r"\bcontrast\b", "dye"),
+    # Cancer terms
+    (r"\bmetastases\b", "spread of the cancer"),
+    (r"\bmetastasis\b", "spread of the cancer"),
+    (r"\bmalignant\b", "cancer"),
+    (r"\bcarcinoma\b", "cancer"),
+    (r"\bbenign\b", "non-cancer"),
+    # Other
+    (r"\bindeterminate\b", "unclear"),
+    (r"\batelectasis\b", "partially collapsed lung"),
+    (r"\bconsolidation\b", "filled airspaces in the lung"),
+    (r"\bnodule(?:s)?\b", "small lump"),
+]
+
+# Applied in list order, so specific entries (e.g. "L5/S1") win over general ones
+_LAY_RULES = [(re.compile(rx, re.IGNORECASE), rep) for rx, rep in _LAY_TERMS]
 
 
 def _simplify_for_layperson(text: str) -> str:
     """Very lightweight jargon simplifier for fallback mode (English only)."""
-    repl = [
-        # Spinal anatomy - specific levels first
-        (r"\bL5/S1\b", "between the lowest back bone and tailbone"),
-        (r"\bL4/L5\b", "between the 4th and 5th bones in your lower back"),
-        (r"\bL3/L4\b", "between the 3rd and 4th bones in your lower back"),
-        (r"\bL2/L3\b", "between the 2nd and 3rd bones in your lower back"),
-        (r"\bL1/L2\b", "between the 1st and 2nd bones in your lower back"),
-        (r"\bC6/C7\b", "between the 6th and 7th bones in your neck"),
-        (r"\bC5/C6\b", "between the 5th and 6th bones in your neck"),
-        (r"\bC4/C5\b", "between the 4th and 5th bones in your neck"),
-        (r"\bC3/C4\b", "between the 3rd and 4th bones in your neck"),
-        (r"\bT\d+/T\d+\b", "between bones in your mid-back"),
-        (r"\bL\d+/L\d+\b", "between bones in your lower back"),
-        (r"\bC\d+/C\d+\b", "between bones in your neck"),
-        # General spinal terms
-        (r"\blumbar spine\b", "lower back"),
-        (r"\bthoracic spine\b", "mid-back"),
-        (r"\bcervical spine\b", "neck"),
-        (r"\bvertebrae\b", "bones in the spine"),
-        (r"\bvertebra\b", "bone in the spine"),
-        (r"\bforamina\b", "nerve tunnels"),
-        (r"\bforamen\b", "nerve tunnel"),
-        (r"\bdisc herniation\b", "slipped disc"),
-        (r"\bherniated disc\b", "slipped disc"),
-        (r"\bspinal canal\b", "main channel in the spine"),
-        (r"\bnerve root\b", "nerve branch"),
-        (r"\bspinal cord\b", "main nerve bundle in the spine"),
-        # Lymph and glands
-        (r"\badenopathy\b", "swollen glands"),
-        (r"\blymphadenopathy\b", "swollen glands"),
-        (r"\blymph nodes\b", "infection-fighting glands"),
-        (r"\blymph node\b", "infection-fighting gland"),
-        # Fluid and swelling
-        (r"\bedema\b", "swelling"),
-        (r"\beffusion\b", "fluid buildup"),
-        (r"\bpleural effusion\b", "fluid around the lung"),
-        (r"\bascites\b", "fluid in the belly"),
-        # Body regions
-        (r"\babdomen(al)?\b", "tummy"),
-        (r"\burinary tract\b", "urine system"),
-        (r"\bureters\b", "urine tubes"),
-        (r"\bureter\b", "urine tube"),
-        # Abnormalities
-        (r"\blesions\b", "abnormal spots"),
-        (r"\blesion\b", "abnormal spot"),
-        (r"\bmass(es)?\b", "lump"),
-        (r"\bneoplasm(s)?\b", "cancer"),
-        # Organs
-        (r"\bhepatic\b", "liver"),
-        (r"\brenal\b", "kidney"),
-        (r"\bpulmonary\b", "lung"),
-        (r"\bcervix\b", "neck of the womb"),
-        # Conditions
-        (r"\bhydronephrosis\b", "severe urine backup"),
-        (r"\bstenosis\b", "narrowing"),
-        (r"\bdilat(e|ed|ation)\b", "widened"),
-        # Procedures
-        (r"\bintravenous contrast\b", "dye through a vein"),
-        (r"\bcontrast\b", "dye"),
-        # Cancer terms
-        (r"\bmetastases\b", "spread of the cancer"),
-        (r"\bmetastasis\b", "spread of the cancer"),
-        (r"\bmalignant\b", "cancer"),
-        (r"\bcarcinoma\b", "cancer"),
-        (r"\bbenign\b", "non-cancer"),
-        # Other
-        (r"\bindeterminate\b", "unclear"),
-        (r"\batelectasis\b", "partially collapsed lung"),
-        (r"\bconsolidation\b", "filled airspaces in the lung"),
-        (r"\bnodule(s)?\b", "small lump"),
-    ]
-    out = text or ""
-    for rx, rep in repl:
-        out = re.sub(rx, rep, out, flags=re.IGNORECASE)
+    # Only fed the str pieces _sentences returns, so no None guard here
+    out = text
+    for rx, rep in _LAY_RULES:
+        out = rx.sub(rep, out)
     return out
 
 
 # -----------------------
 # Kiswahili fallback
 # -----------------------
+_KISWAHILI_NAMES = frozenset({"kiswahili", "swahili"})
+
+
 def _is_kiswahili(language: str | None) -> bool:
     lang = (language or "").strip().lower()
-    return lang in ("kiswahili", "swahili")
+    return lang in _KISWAHILI_NAMES
+
+
+# Phrase-level replacements first (order matters)
+_SW_PHRASES: List[Tuple[str, str]] = [
+    ("urine system", "mfumo wa mkojo"),
+    ("urine tube", "mrija wa mkojo"),
+    ("urine tubes", "mirija ya mkojo"),
+    ("womb (uterus)", "mfuko wa uzazi (uterasi)"),
+    ("womb", "mfuko wa uzazi"),
+    ("hydronephrosis (severe urine backup)", "hidronefrosisi (kuziba kwa mkojo kwa kiwango kikubwa)"),
+    ("widened/swollen", "imepanuka/imevimba"),
+    ("iodine dye", "dawa ya rangi (iodini)"),
+    ("spread of the cancer", "kusambaa kwa saratani"),
+    ("abnormal spot", "eneo lisilo la kawaida"),
+    ("You have", "Una"),
+    ("you have", "una"),
+    ("There is", "Kuna"),
+    ("there is", "kuna"),
+    ("This needs", "Hii inahitaji"),
+    ("Go to the hospital now if", "Nenda hospitali sasa ikiwa"),
+    ("See a neurosurgeon urgently", "Muone daktari wa upasuaji wa ubongo haraka"),
+    ("brain shift", "mchepuko wa ubongo"),
+    ("mass effect", "shinikizo la uvimbe"),
+    ("fronto-parietal", "fronto-parietal (eneo la mbele na upande wa kati)"),
+    ("outside the brain tissue but inside the skull", "nje ya tishu za ubongo lakini ndani ya fuvu"),
+    ("thin slices", "vipande vyembamba"),
+    ("Contrast dye", "Dawa ya rangi"),
+    ("contrast dye", "dawa ya rangi"),
+    ("was done", "ilifanyika"),
+    ("were done", "zilifanyika"),
+    ("No evidence of", "Hakuna ushahidi wa"),
+    ("No significant", "Hakuna kilicho kikubwa"),
+    ("pleural effusion", "majimaji kwenye ganda la mapafu"),
+    ("midline shift", "mchepuko wa mstari wa kati"),
+    ("subfalcine herniation", "kuingia kwa ubongo chini ya pindo la kati"),
+    ("herniation", "kuingia kwa tishu mahali pasipo"),
+    ("lymph nodes", "tezi za limfu"),
+    ("lymph node", "tezi ya limfu"),
+    ("pulmonary embolism", "gandu la damu kwenye mshipa wa mapafu"),
+    ("pulmonary edema", "uvimbe wa maji kwenye mapafu"),
+    ("atelectasis", "kupungua kwa upanuzi wa sehemu ya pafu"),
+    ("consolidation", "muungano wa tishu za pafu"),
+    ("enhancement", "kuonekana zaidi baada ya dawa ya rangi"),
+    ("enhances", "huonekana zaidi baada ya dawa ya rangi"),
+    ("enhanced", "imeonekana zaidi baada ya dawa ya rangi"),
+    ("nodule", "kijivimbe"),
+    ("calcification", "ugumu wa chokaa"),
+    ("metastatic", "iliyosanbaa"),
+]
+
+# Single-word/shorter token replacements
+_SW_WORDS: List[Tuple[str, str]] = [
+    ("tummy", "tumbo"),
+    ("abdomen", "tumbo"),
+    ("abdominal", "tumboni"),
+    ("ureter", "mrija wa mkojo"),
+    ("ureters", "mirija ya mkojo"),
+    ("kidneys", "figo"),
+    ("kidney", "figo"),
+    ("bladder", "kibofu"),
+    ("liver", "ini"),
+    ("brain", "ubongo"),
+    ("head", "kichwa"),
+    ("skull", "fuvu"),
+    ("lung", "pafu"),
+    ("lungs", "mapafu"),
+    ("cervix", "seviksi"),
+    ("lesions", "maeneo yasiyo ya kawaida"),
+    ("lesion", "eneo lisilo la kawaida"),
+    ("mass", "uvimbe"),
+    ("lump", "uvimbe"),
+    ("benign", "siyo saratani"),
+    ("malignant", "saratani"),
+    ("cancer", "saratani"),
+    ("metastases", "maeneo ya saratani iliyosambaa"),
+    ("metastasis", "kusambaa kwa saratani"),
+    ("indeterminate", "haijabainika"),
+    ("dilated", "imepanuka"),
+    ("dilation", "upanuzi"),
+    ("stenosis", "kubana"),
+    ("contrast", "dawa ya rangi"),
+    ("shows", "inaonyesha"),
+    ("spreads", "inasambaa"),
+    ("blocks", "inaziba"),
+    ("blocked", "imeziba"),
+    ("likely", "huenda"),
+    ("scan", "skani"),
+    ("treatment", "matibabu"),
+    ("surgery", "upasuaji"),
+    ("neurosurgeon", "daktari wa upasuaji wa ubongo"),
+    ("headaches", "maumivu ya kichwa"),
+    ("weakness", "udhaifu"),
+    ("confusion", "kuchanganyikiwa"),
+    ("right", "kulia"),
+    ("left", "kushoto"),
+    ("area", "eneo"),
+    ("upper", "juu"),
+    ("lower", "chini"),
+    ("anterior", "ya mbele"),
+    ("posterior", "ya nyuma"),
+    ("superior", "ya juu"),
+    ("inferior", "ya chini"),
+    ("lobe", "sehemu"),
+    ("segment", "sehemu"),
+]
+
+# Applied in list order, so phrase rules run before the words they contain
+_SW_RULES = [
+    (re.compile(rf"\b{re.escape(a)}\b", re.I), b) for a, b in _SW_PHRASES + _SW_WORDS
+]
+
+# Pronoun and "No" shifts applied after the table. The rules touch disjoint
+# words, so one pass over the alternation matches the old sequential subs.
+_SW_TAIL = {"your": "yako", "you": "wewe", "dash_no": "- Hakuna", "no": "Hakuna"}
+_SW_TAIL_RX = re.compile(
+    r"(?P<your>\byour\b)|(?P<you>\byou\b)|(?P<dash_no>^\s*-\s+No\b)|(?P<no>\bNo\b)",
+    re.IGNORECASE | re.MULTILINE,
+)
 
 
 def _to_kiswahili(text: str) -> str:
@@ -179,152 +322,57 @@ def _to_kiswahili(text: str) -> str:
     if not text:
         return ""
 
-    # Phrase-level replacements first (order matters)
-    repl_phrase: List[Tuple[str, str]] = [
-        ("urine system", "mfumo wa mkojo"),
-        ("urine tube", "mrija wa mkojo"),
-        ("urine tubes", "mirija ya mkojo"),
-        ("womb (uterus)", "mfuko wa uzazi (uterasi)"),
-        ("womb", "mfuko wa uzazi"),
-        ("hydronephrosis (severe urine backup)", "hidronefrosisi (kuziba kwa mkojo kwa kiwango kikubwa)"),
-        ("widened/swollen", "imepanuka/imevimba"),
-        ("iodine dye", "dawa ya rangi (iodini)"),
-        ("spread of the cancer", "kusambaa kwa saratani"),
-        ("abnormal spot", "eneo lisilo la kawaida"),
-        ("You have", "Una"),
-        ("you have", "una"),
-        ("There is", "Kuna"),
-        ("there is", "kuna"),
-        ("This needs", "Hii inahitaji"),
-        ("Go to the hospital now if", "Nenda hospitali sasa ikiwa"),
-        ("See a neurosurgeon urgently", "Muone daktari wa upasuaji wa ubongo haraka"),
-        ("brain shift", "mchepuko wa ubongo"),
-        ("mass effect", "shinikizo la uvimbe"),
-        ("fronto-parietal", "fronto-parietal (eneo la mbele na upande wa kati)"),
-        ("outside the brain tissue but inside the skull", "nje ya tishu za ubongo lakini ndani ya fuvu"),
-        ("thin slices", "vipande vyembamba"),
-        ("Contrast dye", "Dawa ya rangi"),
-        ("contrast dye", "dawa ya rangi"),
-        ("was done", "ilifanyika"),
-        ("were done", "zilifanyika"),
-        ("No evidence of", "Hakuna ushahidi wa"),
-        ("No significant", "Hakuna kilicho kikubwa"),
-        ("pleural effusion", "majimaji kwenye ganda la mapafu"),
-        ("midline shift", "mchepuko wa mstari wa kati"),
-        ("subfalcine herniation", "kuingia kwa ubongo chini ya pindo la kati"),
-        ("herniation", "kuingia kwa tishu mahali pasipo"),
-        ("lymph nodes", "tezi za limfu"),
-        ("lymph node", "tezi ya limfu"),
-        ("pulmonary embolism", "gandu la damu kwenye mshipa wa mapafu"),
-        ("pulmonary edema", "uvimbe wa maji kwenye mapafu"),
-        ("atelectasis", "kupungua kwa upanuzi wa sehemu ya pafu"),
-        ("consolidation", "muungano wa tishu za pafu"),
-        ("enhancement", "kuonekana zaidi baada ya dawa ya rangi"),
-        ("enhances", "huonekana zaidi baada ya dawa ya rangi"),
-        ("enhanced", "imeonekana zaidi baada ya dawa ya rangi"),
-        ("nodule", "kijivimbe"),
-        ("calcification", "ugumu wa chokaa"),
-        ("metastatic", "iliyosanbaa"),
-    ]
-
-    # Single-word/shorter token replacements
-    repl_word: List[Tuple[str, str]] = [
-        ("tummy", "tumbo"),
-        ("abdomen", "tumbo"),
-        ("abdominal", "tumboni"),
-        ("ureter", "mrija wa mkojo"),
-        ("ureters", "mirija ya mkojo"),
-        ("kidneys", "figo"),
-        ("kidney", "figo"),
-        ("bladder", "kibofu"),
-        ("liver", "ini"),
-        ("brain", "ubongo"),
-        ("head", "kichwa"),
-        ("skull", "fuvu"),
-        ("lung", "pafu"),
-        ("lungs", "mapafu"),
-        ("cervix", "seviksi"),
-        ("lesions", "maeneo yasiyo ya kawaida"),
-        ("lesion", "eneo lisilo la kawaida"),
-        ("mass", "uvimbe"),
-        ("lump", "uvimbe"),
-        ("benign", "siyo saratani"),
-        ("malignant", "saratani"),
-        ("cancer", "saratani"),
-        ("metastases", "maeneo ya saratani iliyosambaa"),
-        ("metastasis", "kusambaa kwa saratani"),
-        ("indeterminate", "haijabainika"),
-        ("dilated", "imepanuka"),
-        ("dilation", "upanuzi"),
-        ("stenosis", "kubana"),
-        ("contrast", "dawa ya rangi"),
-        ("shows", "inaonyesha"),
-        ("spreads", "inasambaa"),
-        ("blocks", "inaziba"),
-        ("blocked", "imeziba"),
-        ("likely", "huenda"),
-        ("scan", "skani"),
-        ("treatment", "matibabu"),
-        ("surgery", "upasuaji"),
-        ("neurosurgeon", "daktari wa upasuaji wa ubongo"),
-        ("headaches", "maumivu ya kichwa"),
-        ("weakness", "udhaifu"),
-        ("confusion", "kuchanganyikiwa"),
-        ("right", "kulia"),
-        ("left", "kushoto"),
-        ("area", "eneo"),
-        ("upper", "juu"),
-        ("lower", "chini"),
-        ("anterior", "ya mbele"),
-        ("posterior", "ya nyuma"),
-        ("superior", "ya juu"),
-        ("inferior", "ya chini"),
-        ("lobe", "sehemu"),
-        ("segment", "sehemu"),
-    ]
-
     out = text
     # Normalize simple ASCII quotes to avoid oddities
     out = out.replace("\u2019", "'")
 
-    for a, b in repl_phrase:
-        out = re.sub(rf"\b{re.escape(a)}\b", b, out, flags=re.I)
-
-    for a, b in repl_word:
-        out = re.sub(rf"\b{re.escape(a)}\b", b, out, flags=re.I)
+    for rx, b in _SW_RULES:
+        out = rx.sub(b, out)
 
     # Very light pronoun/tense shifts when present
-    out = re.sub(r"\byour\b", "yako", out, flags=re.I)
-    out = re.sub(r"\byou\b", "wewe", out, flags=re.I)
-    out = re.sub(r"(?m)^\s*-\s+No\b", "- Hakuna", out, flags=re.I)
-    out = re.sub(r"\bNo\b", "Hakuna", out, flags=re.I)
+    out = _SW_TAIL_RX.sub(lambda m: _SW_TAIL[m.lastgroup], out)
 
     # Clean extra spaces produced by replacements
-    out = re.sub(r"\s+", " ", out).strip()
+    out = " ".join(out.split())
     return out
 
 
+def _to_sw_html_text(s: str) -> str:
+    # Empty sections are common (no technique, no concern yet); nothing to do
+    if not s:
+        return s
+    # s is already html-escaped; unescape -> translate -> escape again
+    return html.escape(_to_kiswahili(html.unescape(s)))
+
+
+def _sw_li_repl(m: re.Match) -> str:
+    inner = m.group(1) or ""
+    return f"<li>{_to_sw_html_text(inner)}</li>"
+
+
+def _to_sw_findings(html_or_text: str) -> str:
+    body = html_or_text or ""
+    if body.strip().lower().startswith("<ul"):
+        # Translate each <li>...</li> item
+        return _LI_RX.sub(_sw_li_repl, body)
+    # Otherwise treat as dash-text and rebuild UL
+    items = []
+    for ln in body.splitlines():
+        ln = ln.strip()
+        if ln.startswith("- "):
+            items.append(_to_kiswahili(ln[2:]))
+    if not items:
+        return _dashes_to_ul(_to_kiswahili(body))
+    # All-empty items fall back to the escaped dash text, like _dashes_to_ul
+    if any(items):
+        return _items_to_ul(items)
+    return html.escape("\n".join("- " + it for it in items))
+
+
 # -----------------------
 # GPT‑5 call + parsing
 # -----------------------
-REFERENCE_STYLE = (
-    "For the reason for scan section: -You had blood in the urine, so the doctors needed clear "
-    "pictures to look for growths or blockages in the bladder, ureters and kidneys. "
-    "Procedure details section: -A CT machine took many thin pictures of your tummy before and after iodine dye "
-    "was injected, giving sharp views of the urine system. "
-    "Important Findings section: -A lump about 6 × 5 × 4½ cm (chicken-egg sized) grows from the left side of the bladder, "
-    "both inside and outside the bladder wall. -The lump spreads into the lower part of the left urine tube (ureter), "
-    "causing severe swelling of that tube and the left kidney (grade 5 hydronephrosis). -The same lump has also grown into "
-    "the neck of the womb (cervix). -Several small spots are seen in both lower lungs; these likely show the cancer has spread. "
-    "-Liver, spleen, pancreas, adrenal glands, bowel and big blood vessels look normal; spine shows age-related wear. "
-    "CONCLUSION section: -Large bladder cancer has broken through the bladder wall, blocked the left ureter, invaded the cervix, "
-    "and has probably spread to the lungs. NOTE OF CONCERN section: -See a urologist and cancer specialist urgently to plan biopsy, "
-    "staging and treatment such as surgery, chemotherapy or immunotherapy. -The swollen kidney may need a stent or tube (nephrostomy) "
-    "to drain urine and prevent damage. -Go to hospital fast if you get fever, severe side pain, cannot pass urine, or feel breathless."
-)
-
-
-# Override to ensure a layperson-friendly style reference
+# Layperson-friendly style reference for the prompt
 REFERENCE_STYLE = (
     "You convert radiology reports into a kind, patient-facing summary. "
     "Use second person (you/your). Be confident and plain. Avoid hedging. "
@@ -335,6 +383,7 @@ REFERENCE_STYLE = (
 
 def _compose_prompt(meta: Dict[str, str], secs: Dict[str, str], language: str) -> List[dict]:
     """Build a Responses API input payload requesting strict JSON with required keys."""
+    is_sw = _is_kiswahili(language)
     # Build minimal, PHI-free context
     study = (meta.get("study") or "").strip()
     hospital = (meta.get("hospital") or "").strip()
@@ -357,7 +406,7 @@ def _compose_prompt(meta: Dict[str, str], secs: Dict[str, str], language: str) -
     ).replace("{language}", language or "English")
 
     # When Kiswahili is selected, strongly forbid mixed language output
-    if _is_kiswahili(language):
+    if is_sw:
         system += (
             " Use pure, everyday East African Kiswahili. Do NOT mix with English. "
             "Avoid English words entirely. You may keep standard acronyms (CT, MRI, IV, X-ray) "
@@ -442,7 +491,7 @@ def _compose_prompt(meta: Dict[str, str], secs: Dict[str, str], language: str) -
         "TOTAL BUDGET: Keep the entire JSON under 1200 characters, but prioritize completeness over brevity."
     )
 
-    if _is_kiswahili(language):
+    if is_sw:
         developer += (
             "\n\nSTRICT KISWAHILI RULES\n"
             "- Andika kila neno kwa Kiswahili fasaha; usichanganye na Kiingereza.\n"
@@ -470,35 +519,93 @@ def _compose_prompt(meta: Dict[str, str], secs: Dict[str, str], language: str) -
     ]
 
 
-def _call_gpt5(messages: List[dict]) -> str:
+_LLM_ALLOW_VALUES = frozenset({"1", "true", "True", "yes", "YES"})
+
+
+def _llm_enabled() -> bool:
+    """True when INSIDEIMAGING_ALLOW_LLM permits calling the model."""
+    return os.getenv("INSIDEIMAGING_ALLOW_LLM", "0").strip() in _LLM_ALLOW_VALUES
+
+
+# Re-uploads of the same report send identical prompts; keep recent complete
+# responses keyed by a prompt hash.
+_LLM_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_LLM_CACHE_LOCK = threading.Lock()
+_LLM_CACHE_SIZE = int(os.getenv("INSIDEIMAGING_LLM_CACHE_SIZE", "128") or 0)
+
+
+def _llm_cache_key(model: str, max_out: int, messages: List[dict]) -> str:
+    payload = json.dumps([model, max_out, messages], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    with _LLM_CACHE_LOCK:
+        raw = _LLM_CACHE.get(key)
+        if raw is not None:
+            _LLM_CACHE.move_to_end(key)
+        return raw
+
+
+def _llm_cache_put(key: str, raw: str) -> None:
+    if _LLM_CACHE_SIZE <= 0:
+        return
+    with _LLM_CACHE_LOCK:
+        _LLM_CACHE[key] = raw
+        _LLM_CACHE.move_to_end(key)
+        while len(_LLM_CACHE) > _LLM_CACHE_SIZE:
+            _LLM_CACHE.popitem(last=False)
+
+
+# Output budget for the single retry after a truncated JSON response
+_RETRY_MAX_OUTPUT_TOKENS = 800
+
+
+# One client per retry setting, reused across requests so its HTTP connection
+# pool (and TLS sessions) survive between calls. The SDK is imported lazily so
+# the app can run without it in non-LLM mode; a failed import is not cached.
+@lru_cache(maxsize=4)
+def _openai_client(max_retries: int):
+    from openai import OpenAI  # type: ignore
+    return OpenAI(max_retries=max_retries)
+
+
+def _call_gpt5(messages: List[dict], max_output_tokens: Optional[int] = None) -> str:
     """Call the OpenAI Responses API with GPT‑5 and return raw text output.
 
     Honors environment variables:
       - OPENAI_MODEL (default: gpt-5)
       - INSIDEIMAGING_ALLOW_LLM (must be truthy to call)
-      - OPENAI_MAX_OUTPUT_TOKENS (default: 512)
+      - OPENAI_MAX_OUTPUT_TOKENS (default: 512; max_output_tokens overrides)
       - OPENAI_TIMEOUT (seconds; default: 60)
+      - OPENAI_MAX_RETRIES (retries on 429/5xx/timeouts; default: 2)
+      - INSIDEIMAGING_LLM_CACHE_SIZE (memoized responses; default: 128, 0 disables)
     """
-    allow = os.getenv("INSIDEIMAGING_ALLOW_LLM", "0").strip()
-    if allow not in ("1", "true", "True", "yes", "YES"):  # guardrails
-        logger.info("LLM disabled by INSIDEIMAGING_ALLOW_LLM=%r", allow)
-        return ""
-
-    # Lazy import so the app can run without the SDK in non-LLM mode
-    try:
-        from openai import OpenAI  # type: ignore
-    except Exception:
-        logger.exception("openai SDK not available; skipping LLM call")
+    if not _llm_enabled():  # guardrails
+        logger.info("LLM disabled by INSIDEIMAGING_ALLOW_LLM=%r", os.getenv("INSIDEIMAGING_ALLOW_LLM", "0"))
         return ""
 
     model = os.getenv("OPENAI_MODEL", "gpt-5").strip() or "gpt-5"
-    max_out = int(os.getenv("OPENAI_MAX_OUTPUT_TOKENS", "512") or 512)
+    max_out = max_output_tokens or int(os.getenv("OPENAI_MAX_OUTPUT_TOKENS", "512") or 512)
     timeout_s = int(os.getenv("OPENAI_TIMEOUT", "60") or 60)
+    # The SDK retries rate limits, 5xx and timeouts with exponential backoff
+    # and jitter; make the attempt count explicit, like the Textract client
+    max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2") or 2)
+
+    cache_key = _llm_cache_key(model, max_out, messages)
+    cached = _llm_cache_get(cache_key)
+    if cached is not None:
+        logger.info("LLM cache hit (%d chars)", len(cached))
+        return cached
 
     # Some deployments pin verbosity low to encourage brevity
     text_cfg = {"verbosity": "low"}
 
-    client = OpenAI()
+    try:
+        client = _openai_client(max_retries)
+    except ImportError:
+        logger.exception("openai SDK not available; skipping LLM call")
+        return ""
 
     try:
         # gpt-5 supports reasoning parameter, gpt-4o does not
@@ -539,6 +646,9 @@ def _call_gpt5(messages: List[dict]) -> str:
     if raw:
         preview = raw if len(raw) <= 4000 else raw[:4000] + "…[truncated]"
         logger.info("GPT-5 raw output:%s\n%s", " (truncated)" if len(raw) > 4000 else "", preview)
+        # Output cut off at max_output_tokens is "incomplete"; never replay it
+        if getattr(resp, "status", None) == "completed":
+            _llm_cache_put(cache_key, raw)
     return raw
 
 
@@ -548,8 +658,7 @@ def _translate_parts_via_llm(parts: Dict[str, object], *, language: str) -> Opti
     Returns a dict with keys reason, technique, findings, conclusion, concern
     or None if the call is disabled/fails.
     """
-    allow = os.getenv("INSIDEIMAGING_ALLOW_LLM", "0").strip()
-    if allow not in ("1", "true", "True", "yes", "YES"):
+    if not _llm_enabled():
         return None
 
     system = (
@@ -605,6 +714,17 @@ def _translate_parts_via_llm(parts: Dict[str, object], *, language: str) -> Opti
     return None
 
 
+# Captures each fixed heading and the block that follows it. The block ends
+# where a whitespace run containing a newline leads into the next heading;
+# the stop check only runs at the start of such a run (and consumes up to its
+# first newline deterministically) so long blank stretches stay linear. The
+# body is stripped, so ending before the newline rather than at it is moot.
+_SECTION_PARTS_RX = re.compile(
+    r"(?is)\b(Reason for the scan|Procedure details|Important Findings|CONCLUSION|NOTE OF CONCERN)\s*:\s*\n?"
+    r"(.*?)(?:(?<!\s)(?=[^\S\n]*\n\s*(?:Reason for the scan|Procedure details|Important Findings|CONCLUSION|NOTE OF CONCERN)\s*:)|\Z)"
+)
+
+
 def _split_sections(raw: str) -> Dict[str, str]:
     """Split raw model text into our five sections by fixed headings.
 
@@ -620,14 +740,9 @@ def _split_sections(raw: str) -> Dict[str, str]:
 
     # Normalize headings and split
     normalized = raw.replace("\r", "")
-    # Build regex to capture each heading and following block
-    parts_rx = re.compile(
-        r"(?is)\b(Reason for the scan|Procedure details|Important Findings|CONCLUSION|NOTE OF CONCERN)\s*:\s*\n?"
-        r"(.*?)(?=\n\s*(?:Reason for the scan|Procedure details|Important Findings|CONCLUSION|NOTE OF CONCERN)\s*:|\Z)"
-    )
 
     found: Dict[str, str] = {}
-    for m in parts_rx.finditer(normalized):
+    for m in _SECTION_PARTS_RX.finditer(normalized):
         key = m.group(1).lower()
         body = (m.group(2) or "").strip()
         if key.startswith("reason"):
@@ -647,6 +762,15 @@ def _split_sections(raw: str) -> Dict[str, str]:
     return found
 
 
+# Per-key salvage patterns for _salvage_json_like
+_SALVAGE_KEYS = ("reason", "technique", "findings", "conclusion", "concern")
+_JSON_STRING_BODY = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_JSON_STRING_RX = re.compile(_JSON_STRING_BODY, re.S)
+_SALVAGE_STRING_RX = {k: re.compile(rf'"{k}"\s*:\s*' + _JSON_STRING_BODY, re.S) for k in _SALVAGE_KEYS}
+_SALVAGE_PARTIAL_RX = {k: re.compile(rf'"{k}"\s*:\s*"(.*)$', re.S) for k in _SALVAGE_KEYS}
+_SALVAGE_ARRAY_RX = {k: re.compile(rf'"{k}"\s*:\s*\[(.*?)\]', re.S) for k in _SALVAGE_KEYS}
+
+
 def _salvage_json_like(raw: str) -> Dict[str, object]:
     """Best-effort extraction when JSON is truncated or slightly malformed.
 
@@ -656,11 +780,14 @@ def _salvage_json_like(raw: str) -> Dict[str, object]:
     out: Dict[str, object] = {"reason": "", "technique": "", "findings": "", "conclusion": "", "concern": ""}
 
     def grab_string(key: str) -> str:
-        m = re.search(rf'"{key}"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"', raw, flags=re.S)
+        # Both patterns need the quoted key; truncated output often lacks it
+        if f'"{key}"' not in raw:
+            return ""
+        m = _SALVAGE_STRING_RX[key].search(raw)
         if m:
             return (m.group(1) or "").strip()
         # Partial capture (no closing quote): take to end and trim to last sentence end
-        m2 = re.search(rf'"{key}"\s*:\s*"(.*)$', raw, flags=re.S)
+        m2 = _SALVAGE_PARTIAL_RX[key].search(raw)
         if m2:
             val = (m2.group(1) or "").strip()
             # Trim to last ., !, or ? to avoid ragged endings
@@ -673,15 +800,13 @@ def _salvage_json_like(raw: str) -> Dict[str, object]:
         return ""
 
     def grab_array(key: str) -> List[str]:
-        m = re.search(rf'"{key}"\s*:\s*\[(.*?)\]', raw, flags=re.S)
-        items: List[str] = []
-        if m:
-            body = m.group(1) or ""
-            for s in re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', body, flags=re.S):
-                s = (s or "").strip()
-                if s:
-                    items.append(s)
-        return items
+        if f'"{key}"' not in raw:
+            return []
+        m = _SALVAGE_ARRAY_RX[key].search(raw)
+        if not m:
+            return []
+        # Strip and filter the captured strings in the same pass
+        return [s for s in map(str.strip, _JSON_STRING_RX.findall(m.group(1))) if s]
 
     reason = grab_string("reason")
     technique = grab_string("technique")
@@ -705,6 +830,31 @@ def _salvage_json_like(raw: str) -> Dict[str, object]:
 
     return out
 
+# Generic Note of Concern used when the model gives us nothing usable.
+# Stored pre-escaped, ready to drop into the HTML output.
+_GENERIC_CONCERN_EN = html.escape(
+    "See your doctor urgently to plan next steps for treatment. "
+    "Go to hospital if you have severe pain, fever, or worsening symptoms."
+)
+_GENERIC_CONCERN_SW = html.escape(
+    "Muone daktari wako haraka kupanga hatua za matibabu. "
+    "Nenda hospitali ikiwa una maumivu makali, homa, au dalili zinazoongezeka."
+)
+
+_SENT_SPLIT_RX = re.compile(r"(?<=[.!?])\s+")
+_SENT_END_RX = re.compile(r"[.!?]+")
+
+
+def _sentences(s: str, n: int = 5) -> List[str]:
+    """First n non-empty sentences of s (shared by the fallback and backfill paths).
+
+    s must be a str; build_structured's section dicts never hold None.
+    """
+    # Only the leading n pieces can be kept, so stop splitting after them
+    pts = _SENT_SPLIT_RX.split(s, n)
+    return [p for p in map(str.strip, pts) if p][:n]
+
+
 # -----------------------
 # Public interface
 # -----------------------
@@ -716,6 +866,8 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
     """
     text = report_text or ""
     cleaned = _strip_html(text)
+    # Resolved once; every translation branch below keys off it
+    is_sw = _is_kiswahili(language)
 
     # Parse metadata and sections from the raw report
     try:
@@ -730,19 +882,22 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
         logger.exception("sections_from_text failed")
         secs = {"reason": "", "technique": "", "findings": cleaned, "impression": ""}
 
-    # Compose and call GPT‑5
-    messages = _compose_prompt(meta, secs, language)
-    raw = _call_gpt5(messages)
+    # Compose and call GPT‑5. With the LLM disabled there is nothing to send,
+    # so skip building the prompt and go straight to the heuristic fallback.
+    if _llm_enabled():
+        messages = _compose_prompt(meta, secs, language)
+        raw = _call_gpt5(messages)
+    else:
+        logger.info("LLM disabled; skipping prompt composition")
+        raw = ""
 
     # If we got truncated JSON (common with complex Kiswahili), retry with higher token limit
     retry_attempted = False
     if raw and not raw.strip().endswith("}"):
         logger.warning("GPT-5 output appears truncated (doesn't end with }); attempting retry with higher token limit")
-        # Temporarily boost max tokens for retry
-        original_max = os.getenv("OPENAI_MAX_OUTPUT_TOKENS", "512")
-        os.environ["OPENAI_MAX_OUTPUT_TOKENS"] = "800"
-        retry_raw = _call_gpt5(messages)
-        os.environ["OPENAI_MAX_OUTPUT_TOKENS"] = original_max
+        # Boost max tokens for this call only; the process env is shared
+        # with concurrent requests, so don't mutate it
+        retry_raw = _call_gpt5(messages, max_output_tokens=_RETRY_MAX_OUTPUT_TOKENS)
         if retry_raw and len(retry_raw) > len(raw):
             raw = retry_raw
             retry_attempted = True
@@ -758,23 +913,17 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
             "conclusion": secs.get("impression", "").strip(),
             "concern": "",
         }
-        # Convert first N sentences, simplified
-        def sentences(s: str, n: int = 5) -> List[str]:
-            pts = re.split(r"(?<=[.!?])\s+", s)
-            return [p.strip() for p in pts if p.strip()][:n]
-
-        # Build simplified English chunks first
-        reason_parts = [_simplify_for_layperson(x) for x in sentences(fallback["reason"], 2)]
-        tech_parts = [_simplify_for_layperson(x) for x in sentences(fallback["technique"], 2)]
-        find_parts = [_simplify_for_layperson(s) for s in sentences(fallback["findings"], 6)]
-        concl_parts = [_simplify_for_layperson(x) for x in sentences(fallback["conclusion"], 2)]
-
-        # If Kiswahili is selected, translate these simplified parts
-        if _is_kiswahili(language):
-            reason_parts = [_to_kiswahili(p) for p in reason_parts]
-            tech_parts = [_to_kiswahili(p) for p in tech_parts]
-            find_parts = [_to_kiswahili(p) for p in find_parts]
-            concl_parts = [_to_kiswahili(p) for p in concl_parts]
+        # Convert first N sentences, simplified, and translated when Kiswahili
+        # is selected, in a single pass per sentence
+        def lay_parts(src: str, n: int) -> List[str]:
+            if is_sw:
+                return [_to_kiswahili(_simplify_for_layperson(x)) for x in _sentences(src, n)]
+            return [_simplify_for_layperson(x) for x in _sentences(src, n)]
+
+        reason_parts = lay_parts(fallback["reason"], 2)
+        tech_parts = lay_parts(fallback["technique"], 2)
+        find_parts = lay_parts(fallback["findings"], 6)
+        concl_parts = lay_parts(fallback["conclusion"], 2)
 
         reason_txt = html.escape(" ".join(reason_parts))
         tech_txt = html.escape(" ".join(tech_parts))
@@ -798,7 +947,7 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
                 parts = _split_sections(raw)
 
         # If Kiswahili required, try an LLM translation pass on the parsed parts first
-        if _is_kiswahili(language):
+        if is_sw:
             try:
                 translated = _translate_parts_via_llm(parts, language="Kiswahili")
                 if translated:
@@ -808,7 +957,7 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
 
         def _as_text(v: object) -> str:
             if isinstance(v, list):
-                return " ".join(str(x).strip() for x in v if str(x).strip())
+                return " ".join(s for s in (str(x).strip() for x in v) if s)
             return str(v or "").strip()
 
         def _as_bullets_text(v: object) -> str:
@@ -848,7 +997,7 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
                     "Use second person. Avoid identifiers. Write ONLY in {language}."
                 ).replace("{language}", language or "English")
                 
-                if _is_kiswahili(language):
+                if is_sw:
                     system_content += (
                         " Andika kwa Kiswahili safi tu; usichanganye na Kiingereza. "
                         "Tumia maneno rahisi ya kila siku."
@@ -860,7 +1009,7 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
                     "No markdown. No quotes. No JSON."
                 )
                 
-                if _is_kiswahili(language):
+                if is_sw:
                     developer_content += (
                         " LAZIMA kuwa Kiswahili tu; hakuna Kiingereza kabisa."
                     )
@@ -880,7 +1029,7 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
                             "Context from report (plain text):\n"
                             f"Reason: {html.unescape(reason_txt)}\n"
                             f"Technique: {html.unescape(tech_txt)}\n"
-                            f"Findings bullets: {re.sub(r'<[^>]+>', ' ', find_ul)}\n"
+                            f"Findings bullets: {_TAG_RX.sub(' ', find_ul)}\n"
                             f"Conclusion: {html.unescape(concl_txt)}\n"
                             f"Draft concern (may be incomplete): {html.unescape(concern_txt)}\n"
                             "Write the final Note of Concern now."
@@ -897,67 +1046,33 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
         
         # If concern is still empty after refinement, provide a generic fallback
         if not _strip_html(concern_txt):
-            if _is_kiswahili(language):
-                concern_txt = html.escape(
-                    "Muone daktari wako haraka kupanga hatua za matibabu. "
-                    "Nenda hospitali ikiwa una maumivu makali, homa, au dalili zinazoongezeka."
-                )
-            else:
-                concern_txt = html.escape(
-                    "See your doctor urgently to plan next steps for treatment. "
-                    "Go to hospital if you have severe pain, fever, or worsening symptoms."
-                )
+            concern_txt = _GENERIC_CONCERN_SW if is_sw else _GENERIC_CONCERN_EN
 
         # If any sections are empty, backfill from raw report sections heuristically
-        def _sentences(s: str, n: int = 5) -> List[str]:
-            pts = re.split(r"(?<=[.!?])\s+", s or "")
-            return [p.strip() for p in pts if p.strip()][:n]
-
         if not _strip_html(reason_txt):
             simplified_reason = " ".join(_simplify_for_layperson(x) for x in _sentences(secs.get("reason", ""), 2))
-            reason_txt = html.escape(_to_kiswahili(simplified_reason) if _is_kiswahili(language) else simplified_reason)
+            reason_txt = html.escape(_to_kiswahili(simplified_reason) if is_sw else simplified_reason)
         if not _strip_html(tech_txt):
             simplified_tech = " ".join(_simplify_for_layperson(x) for x in _sentences(secs.get("technique", ""), 2))
-            tech_txt = html.escape(_to_kiswahili(simplified_tech) if _is_kiswahili(language) else simplified_tech)
+            tech_txt = html.escape(_to_kiswahili(simplified_tech) if is_sw else simplified_tech)
         if not _strip_html(find_ul):
             fb = _sentences(secs.get("findings", ""), 4)
             simplified_findings = [_simplify_for_layperson(s) for s in fb]
-            if _is_kiswahili(language):
+            if is_sw:
                 simplified_findings = [_to_kiswahili(s) for s in simplified_findings]
             find_ul = _dashes_to_ul("\n".join(f"- {s}" for s in simplified_findings))
         if not _strip_html(concl_txt):
             simplified_concl = " ".join(_simplify_for_layperson(x) for x in _sentences(secs.get("impression", ""), 2))
-            concl_txt = html.escape(_to_kiswahili(simplified_concl) if _is_kiswahili(language) else simplified_concl)
+            concl_txt = html.escape(_to_kiswahili(simplified_concl) if is_sw else simplified_concl)
 
         # If Kiswahili requested, enforce Kiswahili on the structured strings.
-        if _is_kiswahili(language):
-            def _to_sw_html_text(s: str) -> str:
-                # s is already html-escaped; unescape -> translate -> escape again
-                return html.escape(_to_kiswahili(html.unescape(s)))
-
-            def _to_sw_findings(html_or_text: str) -> str:
-                body = html_or_text or ""
-                if body.strip().lower().startswith("<ul"):
-                    # Translate each <li>...</li> item
-                    def repl(m: re.Match) -> str:
-                        inner = m.group(1) or ""
-                        translated = html.escape(_to_kiswahili(html.unescape(inner)))
-                        return f"<li>{translated}</li>"
-                    return re.sub(r"<li>(.*?)</li>", repl, body, flags=re.S|re.I)
-                # Otherwise treat as dash-text and rebuild UL
-                lines = []
-                for ln in (body.splitlines()):
-                    ln = ln.rstrip()
-                    if ln.strip().startswith("- "):
-                        content = ln.strip()[2:]
-                        lines.append("- " + _to_kiswahili(content))
-                return _dashes_to_ul("\n".join(lines) if lines else _to_kiswahili(body))
-
+        if is_sw:
             reason_txt = _to_sw_html_text(reason_txt)
             tech_txt = _to_sw_html_text(tech_txt)
             find_ul = _to_sw_findings(find_ul)
             concl_txt = _to_sw_html_text(concl_txt)
-            if concern_txt:
+            # The generic note is already Kiswahili; skip the translation pass
+            if concern_txt and concern_txt != _GENERIC_CONCERN_SW:
                 concern_txt = _to_sw_html_text(concern_txt)
 
     # Patient block: omit name/identifiers; keep generic study fields
@@ -980,22 +1095,17 @@ def build_structured(report_text: str, glossary: Optional[Glossary] = None, *, l
         "concern": concern_txt,
     }
 
-    # Basic word count for stats (cheap and local)
-    blob = " ".join(
-        _strip_html(out.get(k, ""))
-        for k in ("reason", "technique", "findings", "conclusion", "concern")
-    )
+    # Basic word count for stats (cheap and local). Strip each section once;
+    # the plain text is reused for the length log below.
+    plain = [_strip_html(v) for v in (reason_txt, tech_txt, find_ul, concl_txt, concern_txt)]
+    blob = " ".join(plain)
     out["word_count"] = len(blob.split())
-    out["sentence_count"] = len(re.findall(r"[.!?]+", blob))
+    out["sentence_count"] = len(_SENT_END_RX.findall(blob))
 
     # Log summary lengths for debugging
     logger.info(
         "summary_keys={'reason': %d, 'technique': %d, 'findings': %d, 'conclusion': %d, 'concern': %d}",
-        len(_strip_html(reason_txt)),
-        len(_strip_html(tech_txt)),
-        len(_strip_html(find_ul)),
-        len(_strip_html(concl_txt)),
-        len(_strip_html(concern_txt))
+        *(len(p) for p in plain)
     )
 
     return out
@@ -0,0 +1,11 @@
+from src import db
+
+
+def test_disease_tags_do_not_span_report_fields():
+    structured = {"findings": "Lung bases are cl", "conclusion": "Ear, nose and throat referral", "concern": None}
+
+    blob = db.report_text_blob(structured)
+    assert blob == "Lung bases are cl Ear, nose and throat referral"
+    assert db.detect_disease_tags(blob) == ["general"]
+    # Joined without a separator, "cl" + "Ear" would read as "clear"
+    assert db.detect_disease_tags("Lung bases are clEar, nose and throat referral") == ["normal"]
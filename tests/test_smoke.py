@@ -1,8 +1,4 @@
-﻿import os
-import sys
-
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+﻿from app import _triage_radiology_report
 
 
 def test_ci_runs():
@@ -10,8 +6,6 @@ def test_ci_runs():
 
 
 def test_triage_accepts_radiology_report():
-    from app import _triage_radiology_report
-
     radiology_text = (
         "TECHNIQUE: MRI brain performed without and with intravenous contrast.\n"
         "FINDINGS: There is a 2.3 cm enhancing mass in the right frontal lobe with surrounding edema.\n"
@@ -27,8 +21,6 @@ def test_triage_accepts_radiology_report():
 
 
 def test_triage_rejects_non_medical_document():
-    from app import _triage_radiology_report
-
     syllabus_text = (
         "Course Syllabus for Advanced Creative Writing. "
         "This syllabus outlines the semester schedule, homework circles, and weekly assignments for students. "
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from src import translate
+
+
+def test_simplify_for_layperson_prefers_pleural_effusion_wording():
+    assert translate._simplify_for_layperson("Small pleural effusion on the right.") == (
+        "Small fluid around the lung on the right."
+    )
+    assert translate._simplify_for_layperson("Small joint effusion.") == "Small joint fluid buildup."
+
+
+def _fake_llm(monkeypatch, cache_size, status="completed"):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs["input"])
+        part = SimpleNamespace(text=f"reply {len(calls)}")
+        return SimpleNamespace(status=status, output=[SimpleNamespace(content=[part])])
+
+    client = SimpleNamespace(responses=SimpleNamespace(create=create))
+    monkeypatch.setenv("INSIDEIMAGING_ALLOW_LLM", "1")
+    monkeypatch.setattr(translate, "_openai_client", lambda max_retries: client)
+    monkeypatch.setattr(translate, "_LLM_CACHE", OrderedDict())
+    monkeypatch.setattr(translate, "_LLM_CACHE_SIZE", cache_size)
+    return calls
+
+
+def _prompt(text):
+    return [{"role": "user", "content": text}]
+
+
+def test_llm_cache_returns_stored_response(monkeypatch):
+    calls = _fake_llm(monkeypatch, 128)
+
+    assert translate._call_gpt5(_prompt("a")) == "reply 1"
+    assert translate._call_gpt5(_prompt("a")) == "reply 1"
+    assert len(calls) == 1
+
+
+def test_llm_cache_evicts_least_recently_used(monkeypatch):
+    calls = _fake_llm(monkeypatch, 2)
+
+    translate._call_gpt5(_prompt("a"))
+    translate._call_gpt5(_prompt("b"))
+    translate._call_gpt5(_prompt("a"))  # hit; "b" is now the oldest
+    translate._call_gpt5(_prompt("c"))
+    assert len(translate._LLM_CACHE) == 2
+    assert len(calls) == 3
+
+    assert translate._call_gpt5(_prompt("a")) == "reply 1"
+    assert translate._call_gpt5(_prompt("b")) == "reply 4"
+    assert len(calls) == 4
+
+
+def test_llm_cache_disabled_with_size_zero(monkeypatch):
+    calls = _fake_llm(monkeypatch, 0)
+
+    assert translate._call_gpt5(_prompt("a")) == "reply 1"
+    assert translate._call_gpt5(_prompt("a")) == "reply 2"
+    assert len(calls) == 2
+    assert not translate._LLM_CACHE
+
+
+def test_llm_cache_skips_incomplete_response(monkeypatch):
+    calls = _fake_llm(monkeypatch, 128, status="incomplete")
+
+    assert translate._call_gpt5(_prompt("a")) == "reply 1"
+    assert translate._call_gpt5(_prompt("a")) == "reply 2"
+    assert len(calls) == 2
+    assert not translate._LLM_CACHE
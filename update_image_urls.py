@@ -3,7 +3,10 @@
 Update organ-highlight.js with new Radiopaedia image URLs from the CSV
 """
 import json
+import os
 import re
+import stat
+import tempfile
 
 # Load the URL mapping (normalized version)
 with open('url_mapping_normalized.json', 'r') as f:
@@ -11,34 +14,55 @@ with open('url_mapping_normalized.json', 'r') as f:
 
 # Read the current organ-highlight.js
 with open('static/organ-highlight.js', 'r') as f:
-    content = f.read()
-
-# Track updates
-updates = 0
-skipped = 0
-
-# For each condition in our mapping, find and replace its imageUrl
-for condition, new_url in url_mapping.items():
-    # Escape special regex characters in condition name
-    cond_escaped = re.escape(condition)
-    
-    # Pattern to find the condition's imageUrl line (using single quotes in JS)
-    # Matches: imageUrl: 'any_url_here',
-    pattern = r"('" + cond_escaped + r"':\s*\{[^}]*imageUrl:\s*')[^']*(')"
-    
-    # Try to replace
-    matches = re.findall(pattern, content)
-    if matches:
-        content = re.sub(pattern, r'\1' + new_url + r'\2', content, count=1)
-        updates += 1
-    else:
-        skipped += 1
-        print(f"⚠️  Could not find: {condition}")
-
-# Write the updated file
-with open('static/organ-highlight.js', 'w') as f:
-    f.write(content)
+    original = content = f.read()
+
+# One alternative per condition; lastgroup names the condition that matched
+conditions = list(url_mapping)
+pattern = re.compile("|".join(
+    r"(?P<c%d>'" % i + re.escape(condition) + r"':\s*\{[^}]*imageUrl:\s*')[^']*'"
+    for i, condition in enumerate(conditions)
+)) if conditions else None
+
+updated = set()
+
+
+def _replace_url(m):
+    i = int(m.lastgroup[1:])
+    # Only the first entry for a condition is rewritten
+    if i in updated:
+        return m.group(0)
+    updated.add(i)
+    return m.group(m.lastgroup) + url_mapping[conditions[i]] + "'"
+
+
+if pattern is not None:
+    content = pattern.sub(_replace_url, content)
+
+# Track updates; report every missing condition in one write
+updates = len(updated)
+missing = [condition for i, condition in enumerate(conditions) if i not in updated]
+skipped = len(missing)
+if missing:
+    print("\n".join(f"⚠️  Could not find: {condition}" for condition in missing))
+
+# Write the updated file next to the original and swap it in, so an
+# interrupted run never leaves a truncated organ-highlight.js behind
+changed = content != original
+if changed:
+    fd, tmp_path = tempfile.mkstemp(dir='static', suffix='.js.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        # mkstemp creates the file 0600; keep the original's permissions
+        os.chmod(tmp_path, stat.S_IMODE(os.stat('static/organ-highlight.js').st_mode))
+        os.replace(tmp_path, 'static/organ-highlight.js')
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 print(f"\n✅ Updated {updates} image URLs")
 print(f"⚠️  Skipped {skipped} conditions (not found in JS)")
-print(f"📝 Updated static/organ-highlight.js")
+if changed:
+    print(f"📝 Updated static/organ-highlight.js")
+else:
+    print(f"📝 static/organ-highlight.js already up to date")